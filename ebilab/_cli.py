@@ -15,21 +15,12 @@ from logging import (
 )
 from pathlib import Path
 from subprocess import PIPE, STDOUT, Popen
+from threading import Lock, Timer
 from typing import Any
 
-from .experiment._experiment_manager import ExperimentManager
-from .project import get_current_project
-
-# This import may fail if git is not installed
-try:
-    from git import Repo  # type: ignore # TODO
-    from git.exc import GitCommandNotFound
-except:  # noqa: E722
-    pass
-
 import click
-from watchdog.events import PatternMatchingEventHandler
-from watchdog.observers import Observer
+
+from .project import get_current_project
 
 
 @click.group()
@@ -40,6 +31,7 @@ def cli() -> None:
 @cli.command(help="Discover experiment recipes and launch GUI")
 @click.argument("path")
 def experiment(path: str) -> None:
+    from .experiment._experiment_manager import ExperimentManager
     from .experiment._ui_tkinter import ExperimentUITkinter
 
     target = Path(path).resolve()
@@ -73,6 +65,9 @@ def print_message_full(message: str) -> None:
     help="Watch project directory instead of file.",
 )
 def watch(path: str, watch_project: bool = False) -> None:
+    from watchdog.events import PatternMatchingEventHandler
+    from watchdog.observers import Observer
+
     target = Path(path).resolve()
     project = get_current_project()
 
@@ -84,8 +79,11 @@ def watch(path: str, watch_project: bool = False) -> None:
         print("Python please")
         exit(1)
 
+    target_label = target.relative_to(project.path.root)
+
     class Handler(PatternMatchingEventHandler):
-        last_trigger_time: float | None = None
+        # seconds to wait for events to settle before running
+        debounce_time = 0.2
 
         def __init__(
             self,
@@ -95,17 +93,45 @@ def watch(path: str, watch_project: bool = False) -> None:
             case_sensitive: bool = False,
         ):
             super().__init__(patterns, ignore_patterns, ignore_directories, case_sensitive)  # type: ignore
+            self._timer: Timer | None = None
+            self._timer_lock = Lock()
+            # guarded by _timer_lock
+            self._running = False
+            self._rerun_path: Path | None = None
 
         def on_modified(self, event: Any) -> None:
-            current_time = time.time()
-            if self.last_trigger_time and current_time - self.last_trigger_time < 1:
-                return
-
-            src_path = Path(event.src_path)
+            # Editors fire several events per save; (re)start the timer on every event so that
+            # the script runs once, after the last one
+            with self._timer_lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                self._timer = Timer(self.debounce_time, self._run, args=(Path(event.src_path),))
+                self._timer.daemon = True
+                self._timer.start()
+
+        def _run(self, src_path: Path) -> None:
+            with self._timer_lock:
+                if self._running:
+                    # changes made while running are coalesced into one run after this one
+                    self._rerun_path = src_path
+                    return
+                self._running = True
+
+            path: Path | None = src_path
+            while path is not None:
+                try:
+                    self._run_target(path)
+                except Exception as e:
+                    # keep watching; a queued rerun must still run and clear _running
+                    print(f"Failed to run {target_label}: {e}")
+                with self._timer_lock:
+                    path, self._rerun_path = self._rerun_path, None
+                    if path is None:
+                        self._running = False
+
+        def _run_target(self, src_path: Path) -> None:
             print(f"Change detected: {src_path.relative_to(project.path.root)}")
-
-            self.last_trigger_time = current_time
-            print_message_full(f"Running {target.relative_to(project.path.root)}")
+            print_message_full(f"Running {target_label}")
 
             try:
                 my_env = os.environ.copy()
@@ -120,17 +146,17 @@ def watch(path: str, watch_project: bool = False) -> None:
                     stderr=STDOUT,
                     env=my_env,
                 )
-                if p.stdout is None:
+                stdout = p.stdout
+                if stdout is None:
                     return
-                while p.returncode is None:
-                    data = p.stdout.read(1)
+                # read1() returns whatever is available (up to 64 KiB) instead of a single byte
+                for data in iter(lambda: stdout.read1(65536), b""):  # type: ignore
                     sys.stdout.buffer.write(data)
-                    # sys.stdout.flush()
-                    p.poll()
+                    sys.stdout.buffer.flush()
+                p.wait()
 
             finally:
-                self.last_trigger_time = time.time()
-                print_message_full(f"Completed {target.relative_to(project.path.root)}")
+                print_message_full(f"Completed {target_label}")
 
     if watch_project:
         event_handler = Handler(["*.py"])
@@ -166,11 +192,19 @@ def init(name: str) -> None:
 
     # git initialization
     try:
+        # GitPython is slow to import and only needed here.
+        # This import may fail if git is not installed
+        from git import Repo  # type: ignore # TODO
+        from git.exc import GitCommandNotFound
+
         repo = Repo.init(path)
         if input("Will you track original data by git? (Y/n) > ") != "n":
             os.remove(path / "data" / "original" / ".gitignore")
         repo.git.add(A=True)
         repo.git.commit(m="init: initialized by `ebilab init`")
+    except ImportError:
+        # matched before GitCommandNotFound, which is unbound if the import failed
+        print("Git command not found, skipping...")
     except GitCommandNotFound:
         print("Git command not found, skipping...")
     except:  # noqa: E722
@@ -61,9 +61,11 @@ class ProcessingData:
             return None
         dir = get_current_project().path.data_output
         path = dir / (self._key + ".csv")
-        if path.exists():
+        # missing cache is detected by open() itself to save a stat call
+        try:
             return pd.read_csv(path)
-        return None
+        except FileNotFoundError:
+            return None
 
     def _save(self):
         dir = get_current_project().path.data_output
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from ._experiment_manager import ExperimentManager
+from typing import TYPE_CHECKING, Any
+
 from .protocol import (
     ExperimentContext,
     ExperimentPlotter,
@@ -9,8 +10,21 @@ from .protocol import (
     PlotterContext,
 )
 
+if TYPE_CHECKING:
+    from ._experiment_manager import ExperimentManager as ExperimentManager
+
+
+def __getattr__(name: str) -> Any:
+    # ExperimentManager is loaded on first access to keep this package light to import
+    if name == "ExperimentManager":
+        from ._experiment_manager import ExperimentManager
+
+        return ExperimentManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def launch_experiment(experiments: list[type[ExperimentProtocol]]) -> None:
+    from ._experiment_manager import ExperimentManager
     from ._ui_tkinter import ExperimentUITkinter
 
     experiment_manager = ExperimentManager.from_experiments(experiments)
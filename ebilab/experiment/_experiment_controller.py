@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-import copy
 import csv
 import datetime
 import io
+import operator
 import os
+import queue
 import socket
 import time
+import weakref
+from collections.abc import Callable
 from logging import getLogger
 from pathlib import Path
+from threading import Event as ThreadingEvent
 from threading import Thread
 from typing import Any, TypedDict
 
@@ -34,13 +38,29 @@ class EventLog(TypedDict):
     message: str
 
 
+def _close_files(*files: io.TextIOWrapper) -> None:
+    for file in files:
+        file.close()
+
+
 class ExperimentController(ExperimentContextDelegate):
     experiment: ExperimentProtocol
 
     _ctx: ExperimentContext
-    _running = False
     _file: io.TextIOWrapper | None
     _log_file: io.TextIOWrapper | None
+    _files_finalizer: weakref.finalize[..., ExperimentController] | None = None
+    _data_columns: tuple[str, ...]
+    _row_getter: Callable[[dict[str, Any]], tuple[Any, ...]]
+    _started_time: float
+    _started_datetime: datetime.datetime
+    _row_buffer: list[list[Any]]
+    # rows are handed to writer thread when either limit is reached, or before sleeping
+    _row_buffer_limit = 1000
+    _row_flush_interval = 1.0
+    _row_flushed_t = 0.0
+    _write_queue: queue.SimpleQueue[list[list[Any]] | None]
+    _writer_thread: Thread
 
     def __init__(self, experiment: ExperimentProtocol):
         self.experiment = experiment
@@ -51,13 +71,18 @@ class ExperimentController(ExperimentContextDelegate):
         self.event_data_row: Event[dict[str, Any]] = Event()
         self.event_log = Event[EventLog]()
 
-    def _get_comment_line(self, experiment: ExperimentProtocol, options: dict[str, Any]) -> str:
+        # set by stop(); also wakes ctx.sleep() immediately
+        self._stop_event = ThreadingEvent()
+
+    def _get_comment_line(
+        self, experiment: ExperimentProtocol, options: dict[str, Any], now: datetime.datetime
+    ) -> str:
         """
         Returns:
             str: includes trailing NL
         """
         exp_name = experiment.name
-        date = datetime.datetime.now().strftime("%Y/%m/%d %H:%M:%S")
+        date = now.strftime("%Y/%m/%d %H:%M:%S")
         pc_name = socket.gethostname()
         options_str = ", ".join([f"{k}: {v}" for k, v in options.items()]) if options else ""
 
@@ -85,25 +110,45 @@ class ExperimentController(ExperimentContextDelegate):
         except:  # noqa: E722 FIXME
             logger.debug("ebilab project not found")
             data_dir = Path(".") / "data"
-        dir = data_dir / datetime.datetime.now().strftime("%y%m%d")
+        # single timestamp keeps directory, filenames and comment consistent
+        now = datetime.datetime.now()
+        dir = data_dir / now.strftime("%y%m%d")
         os.makedirs(dir, exist_ok=True)
         label = label or self.experiment.name
-        filename = label + "-" + datetime.datetime.now().strftime("%Y%m%d-%H%M%S") + ".csv"
-        log_filename = label + "-" + datetime.datetime.now().strftime("%Y%m%d-%H%M%S") + ".log"
+        basename = label + "-" + now.strftime("%Y%m%d-%H%M%S")
+        filename = basename + ".csv"
+        log_filename = basename + ".log"
         self._filename = dir / filename
         logger.info(f"Output file: {self._filename}")
-        self._file = open(self._filename, "w", newline="")
+        # large buffer so that each batch from the writer thread is one write() call
+        self._file = open(self._filename, "w", newline="", buffering=1 << 20)
         self._log_file = open(dir / log_filename, "w", newline="")
+        # files are closed when run() ends; this is a fallback if it never gets there
+        self._files_finalizer = weakref.finalize(self, _close_files, self._file, self._log_file)
         self._csv_writer = csv.writer(self._file, quoting=csv.QUOTE_NONNUMERIC)
+        self._row_buffer = []
+        self._row_flushed_t = 0.0
 
-        comment_lines = self._get_comment_line(self.experiment, self._options)
+        comment_lines = self._get_comment_line(self.experiment, self._options, now)
         logger.debug("Comment_lines: " + comment_lines)
         self._file.write(comment_lines)
 
-        header = ["t", "time"] + self.experiment.columns
+        self._data_columns = data_columns = tuple(self.experiment.columns)
+        if len(data_columns) >= 2:
+            self._row_getter = operator.itemgetter(*data_columns)
+        else:
+            # itemgetter returns a bare value for one key, and needs at least one
+            self._row_getter = lambda row: tuple(row[col] for col in data_columns)
+        header = ("t", "time", *self._data_columns)
         logger.debug("Header: " + str(header))
         self._csv_writer.writerow(header)
 
+        # csv is written in another thread so disk I/O does not block steps()
+        self._write_queue = queue.SimpleQueue()
+        self._writer_thread = Thread(target=self._write_rows)
+        self._writer_thread.daemon = True
+        self._writer_thread.start()
+
         def run() -> None:
             try:
                 self.experiment.steps(self._ctx)
@@ -115,16 +160,22 @@ class ExperimentController(ExperimentContextDelegate):
                 logger.exception("Python error occured during experiment")
                 self.event_error.notify(f"Python error occured: {e}")
             finally:
-                logger.debug("running_experiment finished, waiting 1sec")
-                time.sleep(1)
-                self._running = False
+                self._flush_rows()
+                self._write_queue.put(None)
+                self._writer_thread.join()
+                # close now, not when the controller is collected: the UI keeps it
+                # until next start, and it is in a reference cycle with _ctx
+                if self._files_finalizer is not None:
+                    self._files_finalizer()
                 self.event_state_change.notify("stopped")
 
                 logger.info("running_experiment finished")
 
+        # wall clock of each row is derived from t, so both are read together here
+        self._started_datetime = datetime.datetime.now()
         self._started_time = time.perf_counter()
         logger.debug(f"started_time: {self._started_time}")
-        self._running = True
+        self._stop_event.clear()
         self._experiment_thread = Thread(target=run)
         self._experiment_thread.daemon = True
         self._experiment_thread.start()
@@ -134,50 +185,99 @@ class ExperimentController(ExperimentContextDelegate):
         logger.debug("stopping experiment")
         self.event_state_change.notify("stopping")
 
-        self._running = False
+        self._stop_event.set()
         if self._experiment_thread is not None:
             logger.info("joining experiment thread")
             self._experiment_thread.join()
         self.event_state_change.notify("stopped")
 
-        if self._file is not None:
-            self._file.close()
-            self._file = None
-        if self._log_file is not None:
-            self._log_file.close()
-            self._log_file = None
+        if self._files_finalizer is not None:
+            # closes both files; does nothing when called again
+            self._files_finalizer()
+        self._file = None
+        self._log_file = None
         logger.debug("stopped experiment")
 
+    def _flush_rows(self) -> None:
+        """
+        Pass buffered rows to writer thread
+        """
+        if len(self._row_buffer) > 0:
+            self._write_queue.put(self._row_buffer)
+            self._row_buffer = []
+
+    def _write_rows(self) -> None:
+        """
+        Writer thread: write row batches to csv file until None is received
+        """
+        while True:
+            # take every batch queued while the previous write was in progress
+            batches = [self._write_queue.get()]
+            while True:
+                try:
+                    batches.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # None is put last, after the final batch
+            finished = batches[-1] is None
+            try:
+                for rows in batches:
+                    if rows is not None:
+                        self._csv_writer.writerows(rows)
+                # flushed per drain, so rows are on disk once handed over
+                if self._file is not None:
+                    self._file.flush()
+            except Exception as e:
+                logger.exception("Failed to write data")
+                self.event_error.notify(f"Failed to write data: {e}")
+            if finished:
+                return
+
     def _get_t(self) -> float:
         return time.perf_counter() - self._started_time
 
     # ExperimentContextDelegate
     def experiment_ctx_delegate_send_row(self, row: dict[str, Any]) -> None:
-        row = copy.copy(row)
-        row["t"] = self._get_t()
-        row["time"] = datetime.datetime.now()
+        t = self._get_t()
+        now = self._started_datetime + datetime.timedelta(seconds=t)
 
-        self.event_data_row.notify(row)
+        # build a new dict in one step; the caller's row is left untouched.
+        # skipped when nobody listens, e.g. headless run
+        if self.event_data_row.has_listeners():
+            self.event_data_row.notify({**row, "t": t, "time": now})
 
-        # write to file
-        cols = ["t", "time"] + self.experiment.columns
-        row_list = [row.get(col) for col in cols]
-        self._csv_writer.writerow(row_list)
+        # write to file; built from caller's row, not from the dict above
+        try:
+            cells = self._row_getter(row)
+        except KeyError:
+            # some columns are absent in this row; written as empty
+            cells = tuple(map(row.get, self._data_columns))
+        row_list = [t, now, *cells]
+        # rows are written in batches to amortize csv writer overhead
+        self._row_buffer.append(row_list)
+        if (
+            len(self._row_buffer) >= self._row_buffer_limit
+            or t - self._row_flushed_t >= self._row_flush_interval
+        ):
+            self._row_flushed_t = t
+            self._flush_rows()
 
     def experiment_ctx_delegate_send_log(self, message: str) -> None:
         t = self._get_t()
-        time = datetime.datetime.now()
+        # same clock as rows, see experiment_ctx_delegate_send_row
+        now = self._started_datetime + datetime.timedelta(seconds=t)
         if self._log_file is None:
-            logger.warn(f"Failed to write message '{time} t={t}: {message}'")
+            logger.warn(f"Failed to write message '{now} t={t}: {message}'")
             return
         self.event_log.notify(
             {
                 "t": t,
-                "time": time,
+                "time": now,
                 "message": message,
             }
         )
-        self._log_file.write(f"{time} t={t}: {message}\n")
+        self._log_file.write(f"{now} t={t}: {message}\n")
 
         # TODO: write to file
 
@@ -188,9 +288,10 @@ class ExperimentController(ExperimentContextDelegate):
         return self._options
 
     def experiment_ctx_delegate_loop(self) -> None:
-        if not self._running:
+        if self._stop_event.is_set():
             raise ExperimentStoppedByUser()
 
-    def __del__(self) -> None:
-        if self._file is not None:
-            self._file.close()
+    def experiment_ctx_delegate_wait(self, timeout: float) -> None:
+        # rows sent before a long sleep must not wait in the buffer until the next row
+        self._flush_rows()
+        self._stop_event.wait(timeout)
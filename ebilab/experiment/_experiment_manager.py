@@ -3,6 +3,7 @@ from __future__ import annotations
 import dataclasses
 import importlib
 import inspect
+import os
 import sys
 import uuid
 from logging import getLogger
@@ -50,6 +51,7 @@ class ExperimentManager:
     """
 
     _experiments: list[ExperimentProtocolInfo]
+    _experiments_by_key: dict[str, ExperimentProtocolInfo]
 
     def __init__(self, experiments: list[ExperimentProtocolInfo]):
         self.changed_event: Event[list[ExperimentProtocolInfo]] = Event()
@@ -67,7 +69,7 @@ class ExperimentManager:
 
         # Discover protocols
         sys.path.append(str(target.parent))
-        protocols = cls._read_file("", target)
+        protocols = cls._read_dir("", target)
 
         # TODO: sort by name
         # protocols.sort(key=lambda p: p.protocol.name)  # type: ignore
@@ -77,31 +79,35 @@ class ExperimentManager:
         return cls(protocols)
 
     @classmethod
-    def _read_file(cls, baseModule: str, file: Path) -> list[ExperimentProtocolInfo]:
-        if file.is_dir():
-            files = file.glob("*")
-            children = []
-            if baseModule == "":
-                baseModule = file.name
-            else:
-                baseModule = baseModule + "." + file.name
-
-            for f in files:
-                children.extend(cls._read_file(baseModule, f))
-
-            if len(children) == 0:
-                return []
-            return [
-                ExperimentProtocolInfo(
-                    label=file.name,
-                    children=children,
-                    key=str(uuid.uuid4()),
-                )
-            ]
-
-        if file.suffix != ".py":
+    def _read_dir(cls, baseModule: str, dir: Path) -> list[ExperimentProtocolInfo]:
+        children = []
+        if baseModule == "":
+            baseModule = dir.name
+        else:
+            baseModule = baseModule + "." + dir.name
+
+        # DirEntry caches the file type, so no extra stat() is needed per entry
+        with os.scandir(dir) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        for entry in entries:
+            path = Path(entry.path)
+            if entry.is_dir():
+                children.extend(cls._read_dir(baseModule, path))
+            elif path.suffix == ".py":
+                children.extend(cls._read_module(baseModule, path))
+
+        if len(children) == 0:
             return []
+        return [
+            ExperimentProtocolInfo(
+                label=dir.name,
+                children=children,
+                key=str(uuid.uuid4()),
+            )
+        ]
 
+    @classmethod
+    def _read_module(cls, baseModule: str, file: Path) -> list[ExperimentProtocolInfo]:
         ret: list[ExperimentProtocolInfo] = []
         module_name = baseModule + "." + file.stem
         mod = importlib.import_module(module_name)
@@ -159,8 +165,16 @@ class ExperimentManager:
 
     def update_experiments(self, experiments: list[ExperimentProtocolInfo]) -> None:
         self._experiments = experiments
+        self._experiments_by_key = {}
+        self._index_experiments(experiments)
         self.changed_event.notify(self._experiments)
 
+    def _index_experiments(self, experiments: list[ExperimentProtocolInfo]) -> None:
+        for info in experiments:
+            self._experiments_by_key.setdefault(info.key, info)
+            if info.children is not None:
+                self._index_experiments(info.children)
+
     @property
     def experiments(self) -> list[ExperimentProtocolInfo]:
         return self._experiments
@@ -171,18 +185,6 @@ class ExperimentManager:
         Args:
             key(str): like ".1.2.1", ".2", ...
         """
-
-        def _get_by_key(
-            key: str, info_list: list[ExperimentProtocolInfo]
-        ) -> ExperimentProtocolInfo | None:
-            # recursive lookup
-            for info in info_list:
-                if info.key == key:
-                    return info
-                if info.children is not None:
-                    found = _get_by_key(key, info.children)
-                    if found is not None:
-                        return found
-            return None
-
-        return _get_by_key(key, self._experiments)
+        # resolved from the index built in update_experiments(), as this is called on every
+        # UI refresh
+        return self._experiments_by_key.get(key)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import collections
 import datetime
-import queue
+import math
 import subprocess
 import time
 import tkinter as tk
@@ -44,6 +45,8 @@ class ProtocolTree(ttk.Treeview):
     Treeview which can show list of ExperimentProtocol
     """
 
+    _selected_key: str | None = None
+
     def __init__(self, master: ttk.Widget, experiment_manager: ExperimentManager) -> None:
         super().__init__(master, padding=10, selectmode="browse")
         self.bind("<<TreeviewSelect>>", self._on_change)
@@ -69,6 +72,9 @@ class ProtocolTree(ttk.Treeview):
                 )
 
     def _on_change(self, *args, **kwargs) -> None:  # type: ignore
+        # cache selection here to avoid Tcl round-trip on every access
+        selection = self.selection()
+        self._selected_key = selection[0] if len(selection) > 0 else None
         self.event_generate("<<ExperimentChange>>")
 
     @property
@@ -76,11 +82,9 @@ class ProtocolTree(ttk.Treeview):
         """
         Active experiment
         """
-        selection = self.selection()
-        if len(selection) == 0:
+        if self._selected_key is None:
             return None
-        # ids = selection[0].split(".")
-        return self.experiment_manager.get_experiment_by_key(selection[0])
+        return self.experiment_manager.get_experiment_by_key(self._selected_key)
 
     @property
     def selected_experiment(self) -> type[ExperimentProtocol] | None:
@@ -154,6 +158,7 @@ class OptionsPane(ttk.Frame):
     __enabled = True
     __options: dict[str, Any]
     __is_valid = True
+    _fields_signature: tuple[tuple[str, OptionField], ...] | None = None
 
     def __init__(self, master: ttk.Widget, label: str) -> None:
         super().__init__(master, padding=10)
@@ -260,8 +265,13 @@ class OptionsPane(ttk.Frame):
 
     @fields.setter
     def fields(self, fields: dict[str, OptionField]) -> None:
+        # rebuilding widgets is expensive, skip it when fields are identical
+        signature = tuple(fields.items())
+        if signature == self._fields_signature:
+            return
         self.__fields = fields
         self._build_fields(fields)
+        self._fields_signature = signature
 
     def _get_options(self) -> dict[str, Any] | None:
         ret = {}
@@ -350,14 +360,25 @@ class OptionsPane(ttk.Frame):
 
 
 class ExperimentUITkinter:
-    _data: list[dict[str, Any]]
-    _data_queue: queue.Queue[dict[str, Any]]
-    _log_queue: queue.Queue[EventLog]
+    # received rows stored column-wise, so DataFrame is built without per-row inference
+    _data: dict[str, list[Any]]
+    _data_len = 0
+    _result_columns: list[str]
+    _plotter_classes: list[type[ExperimentPlotter]]
+    _data_queue: collections.deque[dict[str, Any]]
+    _log_queue: collections.deque[EventLog]
     _log_cnt = 0
 
     _state: str = "stopped"
     _plotter: ExperimentPlotter | None = None
+    # plotters built while stopped are not prepared, and must not be updated
+    _plotter_prepared = False
     _update_experiment_loop_id: str | None = None
+    _plotter_change_pending = False
+    _plot_dirty = False
+    # minimum seconds between plotter updates, independent of 30 ms data polling
+    _plot_interval = 0.2
+    _last_plot_time = 0.0
     _protocol_options_pane: OptionsPane
     _plotter_options_pane: OptionsPane
 
@@ -368,6 +389,10 @@ class ExperimentUITkinter:
     def __init__(self, experiment_manager: ExperimentManager) -> None:
         super().__init__()
         self.experiment_manager = experiment_manager
+        self._result_columns = []
+        self._plotter_classes = []
+        self._data_queue = collections.deque()
+        self._log_queue = collections.deque()
 
     def _create_ui(self) -> None:
         self._root = tk.Tk()
@@ -469,6 +494,9 @@ class ExperimentUITkinter:
         # plotter options pane
         self._plotter_options_pane = OptionsPane(plot_frm, "Plot options")
         self._plotter_options_pane.grid(row=0, column=1, sticky=tk.NSEW)
+        self._plotter_options_pane.bind(
+            "<<OptionsPaneUpdate>>", self._handle_plotter_options_update
+        )
 
         # bottom notebook
         self._bottom_nb = ttk.Notebook(main_frm)
@@ -514,7 +542,8 @@ class ExperimentUITkinter:
         if not experiment or not experiment_info:
             return
 
-        self.reset_data()
+        # plotter is reset by _handle_plotter_change() below
+        self.reset_data(reset_plotter=False)
 
         # update description
         self._description_label["text"] = experiment.get_description()
@@ -526,17 +555,17 @@ class ExperimentUITkinter:
         for tab in self._plotter_nb.tabs():  # type: ignore
             self._plotter_nb.forget(tab)
 
-        for name in map(lambda cls: cls.name, experiment.plotter_classes or []):
+        self._plotter_classes = list(experiment.plotter_classes or [])
+        names = [cls.name for cls in self._plotter_classes]
+        for name in names or ["-"]:
             tab = tk.Frame(self._plotter_nb)
             self._plotter_nb.add(tab, text=name)
-        if len(experiment.plotter_classes or []) == 0:
-            tab = tk.Frame(self._plotter_nb)
-            self._plotter_nb.add(tab, text="-")
 
         self._handle_plotter_change()
 
         # update cols
-        columns = ["t", "time"] + experiment.columns
+        self._result_columns = list(experiment.columns)
+        columns = ["t", "time"] + self._result_columns
         self._result_tree["columns"] = columns
         self._result_tree.column("#0", width=0, stretch=False)
         self._result_tree.heading("time", text="time")
@@ -564,13 +593,19 @@ class ExperimentUITkinter:
             self._start_button["state"] = "disabled"
 
     def _handle_plotter_change(self, *args: Any, **kwargs: Any) -> None:
-        try:
-            experiment = self._protocol_tree.selected_experiment
-            if experiment is None:
-                return
-            plotter_idx = self._plotter_nb.index(self._plotter_nb.select())  # type: ignore
-            Plotter = (experiment.plotter_classes or [])[plotter_idx]
-        except IndexError:
+        # Rebuilding the tabs fires <<NotebookTabChanged>> several times in a row, so coalesce
+        # them into a single update on the next idle
+        if self._plotter_change_pending:
+            return
+        self._plotter_change_pending = True
+        self._root.after_idle(self._update_plotter)
+
+    def _update_plotter(self) -> None:
+        self._plotter_change_pending = False
+        Plotter = self._get_selected_plotter_class()
+        if Plotter is None:
+            # protocol without plotters, still clear the previous one
+            self._reset_plotter()
             return
         self._plotter_options_pane.fields = Plotter.options or {}
         self._reset_plotter()
@@ -584,12 +619,14 @@ class ExperimentUITkinter:
         self._root.protocol("WM_DELETE_WINDOW", self._handle_quit)
         self._root.mainloop()
 
-    def _get_data_from_queue(self, queue_: queue.Queue[T]) -> list[T]:
+    def _get_data_from_queue(self, queue_: collections.deque[T]) -> list[T]:
+        # deque append/popleft are thread-safe, so no lock is needed between
+        # the experiment thread (producer) and the UI thread (consumer)
         d: list[T] = []
         while True:
             try:
-                d.append(queue_.get(False))
-            except queue.Empty:
+                d.append(queue_.popleft())
+            except IndexError:
                 return d
 
     def _update_experiment_loop(self) -> None:
@@ -609,50 +646,57 @@ class ExperimentUITkinter:
                 t = self.experiment_controller._get_t()
                 self._current_t.set(f"t = {t:.0f}")
 
-            if self._state != "stopped":
-                data = self._get_data_from_queue(self._data_queue)
-
-                for d in data:
-                    self._data.append(d)
-
-                    experiment = self._protocol_tree.selected_experiment
-                    if experiment is None:
-                        return
-
-                    columns = experiment.columns
-
-                    # insert to table
-                    row_list = [str(d["t"]), str(d["time"])]
-                    for col in columns:
-                        if col in d:
-                            row_list.append(str(d[col]))
-                        else:
-                            row_list.append("")
-                    self._result_tree.insert("", tk.END, values=row_list)
-                    self._result_tree.yview_moveto(1)
-                self._draw_plot()
-
-                # update logs
-                logs = self._get_data_from_queue(self._log_queue)
-                for log in logs:
-                    self._log_tree.insert(
-                        "", tk.END, values=[log["t"], log["time"], log["message"]]
-                    )
-                    self._log_tree.yview_moveto(1)
-                    self._log_cnt += 1
-                    self._bottom_nb.tab(1, text=f"Log ({self._log_cnt})")
+            # also drained after the run has stopped, so that rows and logs sent
+            # right before the end are shown
+            data = self._get_data_from_queue(self._data_queue)
+
+            # bind per-batch lookups to locals for the per-row loop
+            append_data = self._append_data_row
+            insert_row = self._result_tree.insert
+            columns = self._result_columns
+            for d in data:
+                append_data(d)
+
+                # insert to table
+                row_list = [str(d["t"]), str(d["time"])]
+                row_list.extend(str(d[col]) if col in d else "" for col in columns)
+                insert_row("", tk.END, values=row_list)
+            # scroll once per batch instead of once per row
+            if len(data) > 0:
+                self._result_tree.yview_moveto(1)
+                self._plot_dirty = True
+            self._draw_plot()
+
+            # update logs
+            logs = self._get_data_from_queue(self._log_queue)
+            for log in logs:
+                self._log_tree.insert("", tk.END, values=[log["t"], log["time"], log["message"]])
+            if len(logs) > 0:
+                self._log_tree.yview_moveto(1)
+                self._log_cnt += len(logs)
+                self._bottom_nb.tab(1, text=f"Log ({self._log_cnt})")
         finally:
             self._update_experiment_loop_id = self._root.after(30, self._update_experiment_loop)
 
+    def _handle_plotter_options_update(self, _: Any) -> None:
+        self._plot_dirty = True
+
     def _draw_plot(self) -> None:
-        if len(self._data) > 0 and self._plotter:
+        # nothing to redraw unless data, plotter or plot options changed since last draw
+        if not self._plot_dirty:
+            return
+        if time.perf_counter() - self._last_plot_time < self._plot_interval:
+            # drawn on a later tick; rows received meanwhile are drawn together
+            return
+        if self._data_len > 0 and self._plotter and self._plotter_prepared:
+            self._plot_dirty = False
+            self._last_plot_time = time.perf_counter()
             df = pd.DataFrame(self._data)
             time_before_plot = time.perf_counter()
             self._plotter.update(df, self._get_plotter_context())
             logger.debug(f"Plotter.update took {time.perf_counter() - time_before_plot} s")
-            time_before_draw = time.perf_counter()
-            self._canvas.draw()
-            logger.debug(f"canvas.draw took {time.perf_counter() - time_before_draw} s")
+            # rendered on the next Tk idle, coalescing requests made before then
+            self._canvas.draw_idle()
 
     def _handle_start_experiment(self) -> None:
         """
@@ -666,6 +710,10 @@ class ExperimentUITkinter:
         self.active_experiment = experiment()  # generate instance
         options = self._protocol_options_pane.options
 
+        # the protocol may have been reloaded since it was selected
+        self._result_columns = list(experiment.columns)
+        self._plotter_classes = list(experiment.plotter_classes or [])
+
         # generate instance
         self.experiment_controller = ExperimentController(self.active_experiment)
 
@@ -702,11 +750,11 @@ class ExperimentUITkinter:
 
     def _handler_experiment_data_row(self, row: dict[str, Any]) -> None:
         """handle ExperimentManager event"""
-        self._data_queue.put(row)
+        self._data_queue.append(row)
 
     def _handle_experiment_log(self, log: EventLog) -> None:
         """handle ExperimentManager event"""
-        self._log_queue.put(log)
+        self._log_queue.append(log)
 
     def _update_ui_from_state(self) -> None:
         if self._state == "running":
@@ -738,26 +786,44 @@ class ExperimentUITkinter:
             self._quit_button["state"] = "enabled"
             self._stop_button["text"] = "Stop"
 
-    def reset_data(self) -> None:
-        self._data = []
-        self._data_queue = queue.Queue()
-        self._log_queue = queue.Queue()
+    def _append_data_row(self, row: dict[str, Any]) -> None:
+        """
+        Append row to column-wise data. Missing values are filled with NaN
+        like pd.DataFrame does for list of dicts.
+        """
+        data = self._data
+        new_column = False
+        for key, value in row.items():
+            column = data.get(key)
+            if column is None:
+                # pad rows received before this column appeared
+                column = data[key] = [math.nan] * self._data_len
+                new_column = True
+            column.append(value)
+        self._data_len += 1
+        if new_column or len(row) != len(data):
+            for column in data.values():
+                if len(column) < self._data_len:
+                    column.append(math.nan)
+
+    def reset_data(self, *, reset_plotter: bool = True) -> None:
+        self._data = {}
+        self._data_len = 0
+        self._data_queue = collections.deque()
+        self._log_queue = collections.deque()
         self._log_cnt = 0
         self._bottom_nb.tab(1, text="Log")
         self._result_tree.delete(*self._result_tree.get_children())
-        self._reset_plotter()
+        if reset_plotter:
+            self._reset_plotter()
 
     def _reset_plotter(self) -> None:
         self._fig.clf()
+        self._plot_dirty = True
+        self._plotter_prepared = False
 
-        try:
-            Experiment = self._protocol_tree.selected_experiment
-            if Experiment is None:
-                self._plotter = None
-                return
-            plotter_idx = self._plotter_nb.index(self._plotter_nb.select())  # type: ignore
-            Plotter = (Experiment.plotter_classes or [])[plotter_idx]
-        except IndexError:
+        Plotter = self._get_selected_plotter_class()
+        if Plotter is None:
             self._plotter = None
             return
 
@@ -766,6 +832,16 @@ class ExperimentUITkinter:
         if self._state == "running":
             ctx = self._get_plotter_context()
             self._plotter.prepare(ctx)  # type: ignore
+            self._plotter_prepared = True
+
+    def _get_selected_plotter_class(self) -> type[ExperimentPlotter] | None:
+        """
+        Resolve the active plotter tab to the plotter class shown in it
+        """
+        plotter_idx: int = self._plotter_nb.index(self._plotter_nb.select())  # type: ignore
+        if plotter_idx >= len(self._plotter_classes):
+            return None
+        return self._plotter_classes[plotter_idx]
 
     def _get_plotter_context(self) -> PlotterContext:
         return PlotterContext(
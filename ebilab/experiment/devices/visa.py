@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from logging import getLogger
 from typing import Any
@@ -25,6 +26,24 @@ class _VisaManagerDevice:
     inst: Any
 
 
+def _probe_device(rm: pyvisa.ResourceManager, addr: str) -> _VisaManagerDevice | None:
+    """
+    Open resource and ask *IDN?. Returns None if device does not respond.
+    """
+    try:
+        inst: Any = rm.open_resource(addr)
+        try:
+            idn = inst.query("*IDN?")
+            logger.debug(f"*IDN? to {addr}: {idn}")
+            return _VisaManagerDevice(idn, inst)
+        except:  # noqa: E722
+            logger.debug(f"No response to *IDN? from {addr}")
+            inst.close()
+    except:  # noqa: E722
+        pass
+    return None
+
+
 class VisaManager:
     """
     Manager class of visa device based on pyvisa module
@@ -59,18 +78,13 @@ class VisaManager:
         visa_list = rm.list_resources()
         logger.debug(f"List resources: {str(visa_list)}")
 
-        for addr in visa_list:
-            try:
-                inst: Any = rm.open_resource(addr)
-                try:
-                    idn = inst.query("*IDN?")
-                    logger.debug(f"*IDN? to {addr}: {idn}")
-                    self._devices[addr] = _VisaManagerDevice(idn, inst)
-                except:  # noqa: E722
-                    logger.debug(f"No response to *IDN? from {addr}")
-                    inst.close()
-            except:  # noqa: E722
-                pass
+        # probe in parallel since devices without response block until timeout
+        with ThreadPoolExecutor() as executor:
+            devices = list(executor.map(lambda addr: _probe_device(rm, addr), visa_list))
+        # keep order of list_resources() because get_inst returns the first match
+        for addr, device in zip(visa_list, devices):
+            if device is not None:
+                self._devices[addr] = device
 
     def get_inst(self, pattern: str) -> Any | None:
         """
@@ -10,13 +10,15 @@ import abc
 import dataclasses
 import time
 from pathlib import Path
-from typing import Any
-
-import matplotlib.pyplot as plt  # type: ignore
-import pandas as pd
+from typing import TYPE_CHECKING, Any
 
 from .options import OptionField
 
+if TYPE_CHECKING:
+    # only used in annotations; both take hundreds of ms to import
+    import matplotlib.pyplot as plt  # type: ignore
+    import pandas as pd
+
 
 # dependencies of ExperimentController
 class ExperimentContextDelegate(metaclass=abc.ABCMeta):
@@ -40,14 +42,32 @@ class ExperimentContextDelegate(metaclass=abc.ABCMeta):
     def experiment_ctx_delegate_loop(self) -> None:
         raise NotImplementedError()
 
+    def experiment_ctx_delegate_wait(self, timeout: float) -> None:
+        """
+        Block until timeout elapses or stop is requested.
+        Default implementation wakes up at least every second.
+        """
+        time.sleep(min(timeout, 1.0))
+
 
 class ExperimentContext:
     _delegate: ExperimentContextDelegate
+    # last part of ctx.sleep() uses time.sleep(): a lock wait with timeout is only as
+    # precise as the system timer tick (about 15.6 ms on Windows)
+    _fine_sleep_time = 0.02
 
     def __init__(self, delegate: ExperimentContextDelegate):
         self._delegate = delegate
 
     def send_row(self, row: dict[str, Any]) -> None:
+        """
+        Record one row of data
+        The row is copied before "t" and "time" are added, so the same dict
+        can be modified and sent again.
+
+        Args:
+            row (dict[str, Any]): Values keyed by column name
+        """
         self._delegate.experiment_ctx_delegate_send_row(row)
 
     def log(self, log: str) -> None:
@@ -72,13 +92,20 @@ class ExperimentContext:
         Args:
             sleep_time (float): Time to sleep
         """
-        target = time.time() + sleep_time
-        while target - time.time() > 1.0:
-            time.sleep(1)
+        # pace to a deadline on a monotonic clock, so wall clock changes do not
+        # stretch the sleep and time spent in loop() is not added on top
+        deadline = time.monotonic() + sleep_time
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if remaining > self._fine_sleep_time:
+                # returns early when stop is requested, then loop() raises
+                self._delegate.experiment_ctx_delegate_wait(remaining - self._fine_sleep_time)
+            else:
+                time.sleep(remaining)
             self.loop()
 
-        time.sleep(target - time.time())
-
 
 @dataclasses.dataclass
 class PlotterContext:
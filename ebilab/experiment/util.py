@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from threading import Lock
 from typing import Generic, TypeVar
 
 T = TypeVar("T")
@@ -12,11 +13,25 @@ class Event(Generic[T]):
     """
 
     def __init__(self) -> None:
-        self.event_listeners: list[Callable[[T], None]] = []
+        # tuple is replaced as a whole on add, so notify reads it without locking
+        self.event_listeners: tuple[Callable[[T], None], ...] = ()
+        self._add_lock = Lock()
 
     def add_listener(self, listener: Callable[[T], None]) -> None:
-        self.event_listeners.append(listener)
+        # serialize writers so that concurrent adds do not drop each other
+        with self._add_lock:
+            self.event_listeners = (*self.event_listeners, listener)
+
+    def has_listeners(self) -> bool:
+        """
+        Whether notify() reaches anyone; lets callers skip building the event
+        """
+        return len(self.event_listeners) > 0
 
     def notify(self, event: T) -> None:
-        for listener in self.event_listeners:
+        listeners = self.event_listeners
+        if not listeners:
+            # e.g. headless run without UI
+            return
+        for listener in listeners:
             listener(event)
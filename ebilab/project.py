@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import itertools
 import os
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -26,6 +27,7 @@ class Project:
     """
 
     _root_dir: Path
+    _path: ProjectPath
 
     def __init__(self, root: str | Path):
         if isinstance(root, str):
@@ -33,13 +35,8 @@ class Project:
         if not (root / "ebilab.ini").exists():
             raise Exception("ebilab project directory not exist.")
         self._root_dir = root
-
-    @property
-    def path(self) -> ProjectPath:
-        """
-        Information about filepath of project
-        """
-        return ProjectPath(
+        # root does not change, so paths are built only once
+        self._path = ProjectPath(
             root=self._root_dir,
             data_original=self._root_dir / "data" / "original",
             data_input=self._root_dir / "data" / "input",
@@ -47,12 +44,29 @@ class Project:
             data_plot=self._root_dir / "data" / "plot",
         )
 
-    def clean_files(self, *, dry: bool):
+    @property
+    def path(self) -> ProjectPath:
+        """
+        Information about filepath of project
+        """
+        return self._path
+
+    def _iter_generated_files(self) -> Iterator[Path]:
         dirs = [self.path.data_input, self.path.data_output, self.path.data_plot]
-        files = itertools.chain(*[dir.glob("*") for dir in dirs])
-        for file in files:
-            if file.name == ".gitignore":
+        for dir in dirs:
+            # os.scandir avoids an extra stat() per entry compared to Path.glob
+            try:
+                entries = os.scandir(dir)
+            except FileNotFoundError:
                 continue
+            with entries:
+                for entry in entries:
+                    if entry.name == ".gitignore":
+                        continue
+                    yield Path(entry.path)
+
+    def clean_files(self, *, dry: bool):
+        for file in self._iter_generated_files():
             if dry:
                 print(f"Would remove {file.relative_to(self.path.root)}")
             else:
@@ -61,9 +75,9 @@ class Project:
 
 
 def _get_current_project() -> Project:
-    _paths = [Path(".").resolve()] + list(Path(".").resolve().parents)
-    for path in _paths:
-        root = path
+    # resolve once and stop at the first match instead of listing all parents
+    cwd = Path(".").resolve()
+    for root in itertools.chain((cwd,), cwd.parents):
         if (root / "ebilab.ini").exists():
             break
     else:
@@ -1,3 +1,5 @@
+import contextlib
+import io
 import os
 from pathlib import Path
 from unittest import TestCase
@@ -19,3 +21,12 @@ class TestFoo(TestCase):
         self.assertTrue(project.path.data_input.exists())
         self.assertTrue(project.path.data_output.exists())
         self.assertTrue(project.path.data_original.exists())
+
+    def test_clean_files_dry(self):
+        os.chdir(Path(__file__).resolve().parent / "sample")
+        project = get_current_project()
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            project.clean_files(dry=True)
+        self.assertIn("Would remove", out.getvalue())
+        self.assertTrue((project.path.data_input / ".gitkeep").exists())